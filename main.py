@@ -1,48 +1,197 @@
 import interactions
 import asyncio
-import whisper
+import bisect
+from cachetools import LRUCache
+import concurrent.futures
+import ctranslate2
+import functools
+import importlib.util
+from faster_whisper import BatchedInferencePipeline, WhisperModel
+from faster_whisper.vad import VadOptions, get_speech_timestamps, merge_segments
 import numpy as np
-import json
+import soundfile as sf
+from scipy.signal import resample_poly
+from watchfiles import Change, awatch
+import orjson
 import os
 import logging
 from pathlib import Path
 import time
 from datetime import datetime, timedelta
-import torch
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger('voice_transcriber')
 
+# One CTranslate2 worker per in-flight transcription, so the encoder of one batch
+# runs concurrently with the decoder of another instead of queueing behind it
+ASR_WORKERS = 2  # per GPU
+
+def prepare_model(output_dir):
+    """Convert and quantize Whisper once, returning the path to load"""
+    if os.path.isdir(output_dir):
+        return output_dir
+    
+    # The converter needs transformers and torch (see requirements.txt); without them
+    # every start would retry a conversion that can't succeed
+    if importlib.util.find_spec("transformers") is None or importlib.util.find_spec("torch") is None:
+        logger.warning(f"transformers[torch] is not installed, loading large-v3 instead of {output_dir}")
+        return "large-v3"
+    
+    try:
+        from ctranslate2.converters import TransformersConverter
+        
+        logger.info(f"Converting openai/whisper-large-v3 into {output_dir} (one-time)")
+        converter = TransformersConverter(
+            "openai/whisper-large-v3",
+            copy_files=["tokenizer.json", "preprocessor_config.json"]
+        )
+        # Convert into a temporary directory so an interrupted run isn't picked up later
+        tmp_dir = f"{output_dir}.tmp"
+        converter.convert(tmp_dir, quantization="int8_float16", force=True)
+        os.replace(tmp_dir, output_dir)
+        return output_dir
+    except Exception as e:
+        logger.warning(f"Model conversion failed, falling back to large-v3: {str(e)}")
+        return "large-v3"
+
+def warmup_model(model, replicas):
+    """Run a dummy transcription on 29s of silence on every model replica"""
+    start_time = time.time()
+    pipeline = BatchedInferencePipeline(model=model)
+    # Under 30s the pipeline makes a single clip itself, without clip timestamps
+    silence = np.zeros(16000 * 29, dtype=np.float32)
+    
+    def transcribe_silence():
+        segments, _ = pipeline.transcribe(
+            silence,
+            language="en",
+            beam_size=1,
+            temperature=0.0,
+            without_timestamps=True,
+            vad_filter=False  # VAD would drop the silence and skip the encoder entirely
+        )
+        list(segments)
+    
+    # Concurrent calls are spread over the replicas, so each one pays its cold start here
+    with concurrent.futures.ThreadPoolExecutor(max_workers=replicas) as executor:
+        for future in [executor.submit(transcribe_silence) for _ in range(replicas)]:
+            future.result()
+    logger.info(f"Model warmup of {replicas} replicas finished in {time.time() - start_time:.1f}s")
+
+def load_whisper_model():
+    """Load, quantize and warm up the Whisper model; blocking, so run it in a thread.
+    Returns the model and the number of replicas it can run concurrently"""
+    # Ask CTranslate2 which GPUs it can use; with several GPUs a model replica is loaded on each
+    gpu_count = ctranslate2.get_cuda_device_count()
+    device = "cuda" if gpu_count > 0 else "cpu"
+    device_index = list(range(gpu_count)) if device == "cuda" else [0]
+    logger.info(f"Using device: {device} {device_index}")
+    
+    # Initialize faster-whisper (CTranslate2) model with CUDA support. INT8 weights with
+    # half-precision activations speed up the bandwidth-bound decoder and halve VRAM;
+    # bfloat16 activations on Ampere+ for numerical stability at equal bandwidth
+    if device == "cuda":
+        # Ask CTranslate2 itself, for every GPU a replica is loaded on; torch also
+        # reports bf16 on older GPUs through emulation
+        bf16_supported = all(
+            "int8_bfloat16" in ctranslate2.get_supported_compute_types("cuda", index)
+            for index in device_index
+        )
+        compute_type = "int8_bfloat16" if bf16_supported else "int8_float16"
+    else:
+        compute_type = "int8"
+    logger.info(f"Using compute type: {compute_type}")
+    
+    # Quantized model is converted once per machine and reused across restarts
+    model_path = prepare_model("whisper-large-v3-ct2")
+    model = WhisperModel(
+        model_path,
+        device=device,
+        device_index=device_index,
+        compute_type=compute_type,
+        num_workers=ASR_WORKERS
+    )
+    
+    # Warm up the model so the first transcription doesn't pay the start-up cost
+    replicas = ASR_WORKERS * len(device_index)
+    warmup_model(model, replicas)
+    return model, replicas
+
 class VoiceTranscriber(interactions.Client):
-    def __init__(self, token):
+    def __init__(self, token, model_future):
         super().__init__(token=token)
         
-        # Check for CUDA availability
-        device = "cuda" if torch.cuda.is_available() else "cpu"
-        logger.info(f"Using device: {device}")
+        # Whisper loads in a background thread (see main) while the gateway connects
+        self.model_future = model_future
+        self.whisper_model = None
+        self.batched_model = None
+        self.model_lock = asyncio.Lock()
+        self.pipeline_batch_size = 8  # speech chunks encoded together, across recordings
+        self.max_batch_recordings = 8  # recordings concatenated into one pipeline call
+        
+        # Silero VAD settings for the silence gate and for merging speech into 30s chunks
+        self.vad_options = VadOptions(max_speech_duration_s=30, min_silence_duration_ms=160)
         
-        # Initialize Whisper model with CUDA support
-        self.whisper_model = whisper.load_model("large").to(device)
-        self.device = device
+        # Run blocking transcriptions off the event loop, one per model replica; sized
+        # once the model has loaded and the GPU count is known
+        self.asr_executor = None
+        self.asr_semaphore = None
         
         # Ensure recordings directory exists
         self.recordings_dir = Path("recordings")
         self.recordings_dir.mkdir(exist_ok=True)
+        # Complete recordings are moved here before transcription, out of the recorder's way
+        self.processing_dir = self.recordings_dir / "processing"
+        self.processing_dir.mkdir(exist_ok=True)
+        
+        # Recordings waiting for transcription, fed by the directory watcher
+        self.recording_queue = asyncio.Queue()
+        self.queued_files = set()
+        # Claimed recordings waiting for a transcription batch; those claimed before a
+        # restart were complete already
+        self.ready_recordings = asyncio.Queue()
+        with os.scandir(self.processing_dir) as it:
+            for entry in it:
+                if entry.name.endswith(".wav"):
+                    self.ready_recordings.put_nowait(Path(entry.path))
+        self.processing_tasks = set()
         
         # Add tracking for last processing time
         self.last_processed = datetime.now()
         
-        self.is_processing = False
+        # Set to end the current session; every /join gets a new one, so tasks left over
+        # from an earlier session can't mistake the next session for their own
+        self.stop_event = None
         self.current_voice_state = None  # Add this to track voice state
         
-        # Add speaking tracking
-        self.is_speaking = False
-        self.last_speech_time = time.time()
+        # Users currently speaking, mapped to when they started
+        self.speech: dict[int, float] = {}
+        
+        # Set once speech has stopped for at least a second, so recordings end on a pause
+        self.silence_confirmed = asyncio.Event()
+        self.silence_confirmed.set()
+        self.silence_timer = None
         
-        # Add user cache
-        self.user_cache = {}
+        # Recording length: base duration, extended while people speak up to the cap
+        self.recording_duration = 20  # seconds
+        self.max_recording_duration = 60  # seconds
         
+        # Add user cache, bounded so it doesn't grow without limit across guilds
+        self.user_cache = LRUCache(maxsize=4096)
+        
+    async def wait_for_model(self):
+        """Wait for the background model load to finish"""
+        # Several /join calls can wait for the load at once; only the first sets the model up
+        async with self.model_lock:
+            if self.whisper_model is None:
+                model, replicas = await asyncio.wrap_future(self.model_future)
+                self.asr_executor = concurrent.futures.ThreadPoolExecutor(max_workers=replicas)
+                self.asr_semaphore = asyncio.Semaphore(replicas)
+                # Batched pipeline encodes the speech chunks of several recordings together on the GPU
+                self.batched_model = BatchedInferencePipeline(model=model)
+                self.whisper_model = model
+    
     async def get_username(self, user_id, guild_id):
         """Get username for a given user ID, with caching"""
         cache_key = f"{user_id}_{guild_id}"
@@ -50,9 +199,8 @@ class VoiceTranscriber(interactions.Client):
             return self.user_cache[cache_key]
             
         try:
-            # Try to fetch the member from the guild
-            guild = await self.fetch_guild(guild_id)
-            member = await guild.fetch_member(user_id)
+            # Served from the gateway's member cache, only hits the API on a miss
+            member = await self.fetch_member(user_id, guild_id)
             username = member.display_name or member.username
             self.user_cache[cache_key] = username
             return username
@@ -60,48 +208,37 @@ class VoiceTranscriber(interactions.Client):
             logger.error(f"Error fetching username for {user_id}: {str(e)}")
             return f"User_{user_id}"  # Fallback if we can't get the username
 
-    async def cycle_recording(self, voice_state):
+    async def cycle_recording(self, voice_state, stop_event):
         """Cycles the recording based on speech detection"""
         try:
-            while self.is_processing:
+            while not stop_event.is_set():
                 try:
                     # Start a new recording
                     new_recording = voice_state.start_recording(
                         output_dir=str(self.recordings_dir),
                         encoding="wav"
                     )
-                    await asyncio.sleep(0.1)
-                    
-                    # Base recording duration
-                    recording_duration = 20  # seconds
                     start_time = time.time()
                     
-                    # Keep recording while speaking or shortly after speech ends
-                    while True:
-                        current_time = time.time()
-                        elapsed_time = current_time - start_time
-                        time_since_last_speech = current_time - self.last_speech_time
-                        
-                        # Log the current state for debugging
-                        logger.debug(f"Recording state - Speaking: {self.is_speaking}, "
-                                   f"Elapsed: {elapsed_time:.1f}s, "
-                                   f"Since last speech: {time_since_last_speech:.1f}s")
-                        
-                        # If speaking, extend duration and continue
-                        if self.is_speaking:
-                            recording_duration = max(recording_duration, elapsed_time + 2)
-                            logger.debug(f"Extended recording duration to {recording_duration}")
-                            await asyncio.sleep(0.1)
-                            continue
-                        
-                        # If not speaking, check if we should stop
-                        if time_since_last_speech >= 1.0 and elapsed_time >= recording_duration:
-                            break
-                        
-                        await asyncio.sleep(0.1)
+                    # Record for at least the base duration
+                    await asyncio.sleep(self.recording_duration)
+                    
+                    # Then keep recording until nobody has spoken for a second, up to the cap
+                    try:
+                        await asyncio.wait_for(
+                            self.silence_confirmed.wait(),
+                            timeout=self.max_recording_duration - self.recording_duration
+                        )
+                    except asyncio.TimeoutError:
+                        logger.debug("Reached maximum recording duration while speaking")
+                    
+                    if stop_event.is_set():
+                        # The recorder now belongs to /leave or the next session
+                        new_recording.close()
+                        break
                     
                     # Stop the recording and start a new cycle
-                    logger.info(f"Stopping recording after {recording_duration:.1f} seconds")
+                    logger.info(f"Stopping recording after {time.time() - start_time:.1f} seconds")
                     await voice_state.stop_recording()
                     await new_recording
                     
@@ -112,19 +249,67 @@ class VoiceTranscriber(interactions.Client):
         except Exception as e:
             logger.error(f"Error in cycle_recording: {str(e)}")
     
+    def stop_processing(self):
+        """Stop the current session and reset its speaking state"""
+        if self.stop_event:
+            self.stop_event.set()
+        # Speech tracking stops with the session, so don't let its speakers hold up the next one
+        self.speech.clear()
+        if self.silence_timer:
+            self.silence_timer.cancel()
+            self.silence_timer = None
+        self.silence_confirmed.set()
+    
+    def speech_started(self, user_id):
+        """Record that a user started speaking, holding the recording open"""
+        # Speech invalidates a pending silence confirmation
+        if self.silence_timer:
+            self.silence_timer.cancel()
+            self.silence_timer = None
+        self.speech.setdefault(user_id, time.time())
+        self.silence_confirmed.clear()
+        logger.debug(f"User {user_id} started speaking")
+    
+    def speech_stopped(self, user_id):
+        """Record that a user stopped speaking, confirming silence once nobody is"""
+        started = self.speech.pop(user_id, None)
+        if started is None:
+            return
+        logger.debug(f"User {user_id} stopped speaking after {time.time() - started:.1f}s")
+        if not self.speech:
+            # Confirm silence once nobody has spoken for a second
+            self.silence_timer = asyncio.get_running_loop().call_later(1.0, self.silence_confirmed.set)
+    
+    async def track_speech(self, voice_state, stop_event):
+        """Follow who is speaking from the voice packets the recorder receives"""
+        # The gateway sends no speaking events, but Discord only sends a user's voice packets
+        # while they talk, every 20ms, so a gap of a few packets marks a pause
+        while not stop_event.is_set():
+            recorder = voice_state.recorder
+            if recorder and recorder.audio:
+                now = time.monotonic()  # the clock the recorder stamps packets with
+                # Copy first; the recorder thread adds users while we read
+                last_packets = dict(recorder.audio.last_timestamps)
+                for user_id, last_packet in last_packets.items():
+                    if now - last_packet < 0.2 and user_id not in self.speech:
+                        self.speech_started(user_id)
+                for user_id in list(self.speech):
+                    if now - last_packets.get(user_id, 0) >= 0.2:
+                        self.speech_stopped(user_id)
+            await asyncio.sleep(0.1)
+    
     @interactions.listen()
     async def on_voice_state_update(self, event):
-        """Track when users start/stop speaking"""
-        if event.after and event.after.user.id == self.user.id:
+        """Stop tracking users who leave, move or are muted while speaking"""
+        state = event.after or event.before
+        if not state or state.user_id == self.user.id:
             return  # Ignore bot's own voice state
-            
-        if event.after and event.after.speaking:
-            self.is_speaking = True
-            self.last_speech_time = time.time()
-            logger.debug("User started speaking")
-        else:
-            self.is_speaking = False
-            logger.debug("User stopped speaking")
+        
+        # Voice states carry no speaking flag (see track_speech), but these end a user's
+        # speech at once, without waiting for the gap in their packets
+        left = event.after is None or (event.before and event.before.channel != event.after.channel)
+        if left or event.after.mute or event.after.self_mute:
+            self.speech_stopped(state.user_id)  # No-op for someone who wasn't speaking
     
     @interactions.slash_command(name="join", description="Join your voice channel and start transcribing")
     async def join(self, ctx: interactions.SlashContext):
@@ -133,13 +318,19 @@ class VoiceTranscriber(interactions.Client):
             return
         
         # Stop any existing processing
-        self.is_processing = False
+        self.stop_processing()
         await asyncio.sleep(1)
         
         # Start new processing session
-        self.is_processing = True
+        stop_event = asyncio.Event()
+        self.stop_event = stop_event
         
         try:
+            # The model may still be loading; defer so the interaction doesn't time out
+            if self.whisper_model is None:
+                await ctx.defer()
+                await self.wait_for_model()
+            
             voice_state = await ctx.author.voice.channel.connect()
             self.current_voice_state = voice_state
             await ctx.send(f"Joined {ctx.author.voice.channel.name}")
@@ -150,59 +341,240 @@ class VoiceTranscriber(interactions.Client):
                 encoding="wav"
             )
             
-            # Start both tasks
-            asyncio.create_task(self.continuous_processing(ctx))
-            asyncio.create_task(self.cycle_recording(voice_state))
+            # Start watcher, worker, speech tracking and recording tasks
+            asyncio.create_task(self.watch_recordings(stop_event))
+            asyncio.create_task(self.continuous_processing(ctx, stop_event))
+            asyncio.create_task(self.continuous_transcription(ctx, stop_event))
+            asyncio.create_task(self.track_speech(voice_state, stop_event))
+            asyncio.create_task(self.cycle_recording(voice_state, stop_event))
             
         except Exception as e:
             logger.error(f"Error in join command: {str(e)}")
             await ctx.send("Failed to join voice channel. Please try again.")
     
-    async def continuous_processing(self, ctx):
-        """Continuously process recordings"""
+    def enqueue_recording(self, file_path):
+        """Queue a recording for transcription unless it is already pending"""
+        file_path = Path(os.path.abspath(file_path))
+        if file_path not in self.queued_files:
+            self.queued_files.add(file_path)
+            self.recording_queue.put_nowait(file_path)
+    
+    async def watch_recordings(self, stop_event):
+        """Queue recordings as soon as the recorder writes them"""
+        logger.info("Watching recordings directory")
+        # Pick up recordings left over from a previous session
+        with os.scandir(self.recordings_dir) as it:
+            for entry in it:
+                if entry.name.endswith(".wav"):
+                    self.enqueue_recording(entry.path)
+        
+        try:
+            # The stop event also ends a debounce in progress. Claimed recordings are already
+            # handled, so the processing directory isn't watched
+            async for changes in awatch(self.recordings_dir, recursive=False, stop_event=stop_event):
+                if stop_event.is_set():
+                    break
+                for change, path in changes:
+                    if change in (Change.added, Change.modified) and path.endswith(".wav"):
+                        self.enqueue_recording(path)
+        except Exception as e:
+            logger.error(f"Error watching recordings: {str(e)}")
+    
+    def load_audio(self, file_path):
+        """Read a WAV straight into a 16 kHz mono float32 array, without ffmpeg"""
+        with sf.SoundFile(str(file_path)) as f:
+            sample_rate = f.samplerate
+            audio = f.read(dtype="float32", always_2d=False)
+        
+        # Discord recordings are 48 kHz stereo; Whisper expects 16 kHz mono
+        if audio.ndim > 1:
+            audio = audio.mean(axis=1)
+        if sample_rate != 16000:
+            audio = resample_poly(audio, 16000, sample_rate).astype(np.float32, copy=False)
+        return audio
+    
+    def transcribe_batch(self, file_paths):
+        """Transcribe several recordings in one pipeline call; blocking, so run it in the ASR executor"""
+        audios = []
+        clips = []
+        file_starts = []  # seconds into the concatenated audio where each recording begins
+        offset = 0
+        for file_path in file_paths:
+            try:
+                audio = self.load_audio(file_path)
+                speech = get_speech_timestamps(audio, self.vad_options)
+            except Exception as e:
+                # An unreadable recording contributes no clips; the others are still transcribed
+                logger.error(f"Error reading file {file_path}: {str(e)}")
+                audio = np.zeros(0, dtype=np.float32)
+                speech = []
+            
+            # Recordings without any speech contribute no clips, so they never reach the encoder
+            if not speech:
+                logger.debug(f"No speech detected in {file_path}")
+            
+            # Merge the speech spans into chunks of up to 30s, shifted to the recording's place
+            # in the concatenated audio, so chunks from all recordings share the batches
+            for chunk in merge_segments(speech, self.vad_options):
+                clips.append({"start": chunk["start"] + offset, "end": chunk["end"] + offset})
+            file_starts.append(offset / 16000)
+            audios.append(audio)
+            offset += audio.shape[0]
+        
+        if not clips:
+            return ["" for _ in file_paths]
+        
+        segments, info = self.batched_model.transcribe(
+            np.concatenate(audios),
+            language="en",
+            task="transcribe",
+            beam_size=1,
+            # Greedy decoding at a single temperature, so there is no fallback ladder to re-run
+            temperature=0.0,
+            without_timestamps=True,  # the pipeline's default, which the mapping below relies on
+            vad_filter=False,
+            clip_timestamps=clips,
+            batch_size=self.pipeline_batch_size
+        )
+        
+        # Segments are generated lazily; iterating them runs the decoder. Without timestamps each
+        # chunk becomes one segment starting where the chunk does, so it maps back to its
+        # recording by its start, which is rounded to the millisecond
+        texts = [[] for _ in file_paths]
+        for seg in segments:
+            texts[bisect.bisect_right(file_starts, seg.start + 0.001) - 1].append(seg.text)
+        return ["".join(text).strip() for text in texts]
+    
+    def remove_recording(self, file_path):
+        """Delete a handled recording, ignoring files that are already gone"""
+        try:
+            os.unlink(file_path)
+        except FileNotFoundError:
+            pass
+    
+    async def wait_until_complete(self, file_path, stop_event):
+        """Wait until the recorder has stopped writing a file; returns its stat, or None"""
+        while not stop_event.is_set():
+            try:
+                stat = os.stat(file_path)
+            except FileNotFoundError:
+                return None  # Already processed
+            
+            # Only process files that are complete (not being written to)
+            file_age = time.time() - stat.st_mtime
+            if file_age > 0.75:
+                return stat
+            await asyncio.sleep(0.75 - file_age)
+        return None
+    
+    def claim_recording(self, file_path):
+        """Move a complete recording to a unique name in the processing directory"""
+        # The recorder writes every cycle to the same file name, so a recording left in place
+        # would be overwritten by the next one before it is transcribed
+        claimed_path = self.processing_dir / f"{file_path.stem}_{time.time_ns()}.wav"
+        os.replace(file_path, claimed_path)
+        return claimed_path
+    
+    async def prepare_recording(self, file_path, stop_event):
+        """Wait until a recording is complete and claim it for transcription"""
+        claimed_path = None
+        try:
+            stat = await self.wait_until_complete(file_path, stop_event)
+            if stat is None:
+                return  # Gone, or processing stopped; a new session picks it up again
+            
+            claimed_path = self.claim_recording(file_path)
+            if stat.st_size > 1024:
+                self.ready_recordings.put_nowait(claimed_path)
+            else:
+                self.remove_recording(claimed_path)  # Too small to hold speech
+        except Exception as e:
+            logger.error(f"Error processing file {file_path}: {str(e)}")
+            if claimed_path is not None:
+                self.remove_recording(claimed_path)
+        finally:
+            # From here on a new recording under the same name is queued again
+            self.queued_files.discard(file_path)
+    
+    async def transcribe_recordings(self, ctx, batch, semaphore):
+        """Transcribe a batch of recordings and post the results, then release its GPU slot"""
+        logger.info(f"Processing {len(batch)} recordings: {', '.join(str(file_path) for file_path in batch)}")
+        try:
+            loop = asyncio.get_running_loop()
+            transcriptions = await loop.run_in_executor(
+                self.asr_executor,
+                functools.partial(self.transcribe_batch, batch)
+            )
+        except Exception as e:
+            logger.error(f"Error processing batch of {len(batch)} recordings: {str(e)}")
+            transcriptions = ["" for _ in batch]
+        finally:
+            semaphore.release()
+        
+        for file_path, transcription in zip(batch, transcriptions):
+            # Each recording is posted on its own, so one failure doesn't drop the others
+            try:
+                if transcription:
+                    # Extract user ID from filename, without the suffix added when it was claimed
+                    stem = file_path.stem.rsplit('_', 1)[0]
+                    user_id = stem.split('_')[1] if '_' in stem else stem
+                    # Get username
+                    username = await self.get_username(user_id, ctx.guild_id)
+                    await ctx.channel.send(f"{username}: {transcription}")
+            except Exception as e:
+                logger.error(f"Error processing file {file_path}: {str(e)}")
+            self.remove_recording(file_path)
+    
+    async def continuous_processing(self, ctx, stop_event):
+        """Continuously process queued recordings"""
         logger.info("Starting continuous processing")
-        while self.is_processing:
+        while not stop_event.is_set():
             try:
-                files = list(self.recordings_dir.glob("*.wav"))
-                for file_path in files:
-                    try:
-                        file_age = time.time() - file_path.stat().st_mtime
-                        # Only process files that are complete (not being written to)
-                        if file_age > 0.75 and not self.is_speaking:
-                            file_size = file_path.stat().st_size
-                            if file_size > 1024:
-                                logger.info(f"Processing file {file_path} (age: {file_age}s, size: {file_size})")
-                                result = self.whisper_model.transcribe(
-                                    str(file_path),
-                                    language="en",
-                                    task="transcribe",
-                                    condition_on_previous_text=False,
-                                    prompt="Speak naturally.",
-                                    temperature=0.0,
-                                    compression_ratio_threshold=1.5,
-                                    no_speech_threshold=0.6,
-                                    fp16=True  # Enable half-precision for faster GPU processing
-                                )
-                                
-                                transcription = result["text"].strip()
-                                if transcription:
-                                    # Extract user ID from filename
-                                    user_id = file_path.stem.split('_')[1] if '_' in file_path.stem else file_path.stem
-                                    # Get username
-                                    username = await self.get_username(user_id, ctx.guild_id)
-                                    await ctx.channel.send(f"{username}: {transcription}")
-                            
-                            if file_path.exists():
-                                file_path.unlink()
-                    except Exception as e:
-                        logger.error(f"Error processing file {file_path}: {str(e)}")
-                        if file_path.exists():
-                            file_path.unlink()
+                try:
+                    file_path = await asyncio.wait_for(self.recording_queue.get(), timeout=0.5)
+                except asyncio.TimeoutError:
+                    continue
+                
+                # Each recording waits for the recorder separately, so one that is still
+                # being written doesn't hold up others
+                task = asyncio.create_task(self.prepare_recording(file_path, stop_event))
+                self.processing_tasks.add(task)
+                task.add_done_callback(self.processing_tasks.discard)
                 
             except Exception as e:
                 logger.error(f"Error in continuous processing: {str(e)}")
-            
-            await asyncio.sleep(0.5)
+    
+    async def continuous_transcription(self, ctx, stop_event):
+        """Continuously transcribe claimed recordings, batching those that pile up"""
+        logger.info("Starting continuous transcription")
+        while not stop_event.is_set():
+            try:
+                try:
+                    first = await asyncio.wait_for(self.ready_recordings.get(), timeout=0.5)
+                except asyncio.TimeoutError:
+                    continue
+                
+                # Bound concurrent GPU transcriptions to avoid running out of memory. Recordings
+                # that become ready while every slot is busy join the next batch, so there is
+                # no added wait when idle and full batches under load
+                semaphore = self.asr_semaphore
+                await semaphore.acquire()
+                if stop_event.is_set():
+                    # Stopped while waiting for a slot; leave the recording to the next session
+                    semaphore.release()
+                    self.ready_recordings.put_nowait(first)
+                    break
+                batch = [first]
+                while len(batch) < self.max_batch_recordings and not self.ready_recordings.empty():
+                    batch.append(self.ready_recordings.get_nowait())
+                
+                # Batches overlap in the executor while the event loop stays responsive
+                task = asyncio.create_task(self.transcribe_recordings(ctx, batch, semaphore))
+                self.processing_tasks.add(task)
+                task.add_done_callback(self.processing_tasks.discard)
+                
+            except Exception as e:
+                logger.error(f"Error in continuous transcription: {str(e)}")
     
     @interactions.slash_command(name="leave", description="Leave the voice channel")
     async def leave(self, ctx: interactions.SlashContext):
@@ -210,7 +582,7 @@ class VoiceTranscriber(interactions.Client):
             await ctx.send("I'm not in a voice channel!")
             return
         
-        self.is_processing = False
+        self.stop_processing()
         await asyncio.sleep(1)
         
         if self.current_voice_state:
@@ -222,18 +594,21 @@ class VoiceTranscriber(interactions.Client):
 
 def main():
     # Load configuration
-    if not os.path.exists('config.json'):
-        with open('config.json', 'w') as f:
-            json.dump({
-                'token': 'YOUR_BOT_TOKEN_HERE'
-            }, f, indent=4)
+    config_path = Path('config.json')
+    if not config_path.exists():
+        config_path.write_bytes(orjson.dumps({
+            'token': 'YOUR_BOT_TOKEN_HERE'
+        }, option=orjson.OPT_INDENT_2))
         print("Created config.json template. Please add your Discord bot token.")
         return
     
-    with open('config.json', 'r') as f:
-        config = json.load(f)
+    config = orjson.loads(config_path.read_bytes())
+    
+    # Start loading Whisper right away so the Discord gateway connects in parallel
+    model_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    model_future = model_executor.submit(load_whisper_model)
     
-    bot = VoiceTranscriber(token=config['token'])
+    bot = VoiceTranscriber(token=config['token'], model_future=model_future)
     bot.start()
 
 if __name__ == "__main__":